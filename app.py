@@ -1,12 +1,16 @@
 """tui-explorer: A yazi-inspired terminal file manager built with Textual."""
 
+import asyncio
 import grp
 import os
 import pwd
 import shutil
 import stat
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from pathlib import Path
 
 from rich.markup import escape
@@ -16,36 +20,194 @@ from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
 from textual.screen import ModalScreen
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import Button, Header, Input, Label
+from textual.worker import get_current_worker
 
 VERSION = "0.1.1"
 
 
+_SIZE_UNITS = ("B", "K", "M", "G", "T", "P")
+
+
 def format_size(size: int) -> str:
-    for unit in ("B", "K", "M", "G", "T"):
-        if size < 1024:
-            return f"{size:>5.1f}{unit}" if unit != "B" else f"{size:>5}{unit}"
-        size /= 1024
-    return f"{size:>5.1f}P"
+    if size < 1024:
+        return f"{size:>5}B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    idx = min((size.bit_length() - 1) // 10, 5)
+    return f"{size / (1 << (idx * 10)):>5.1f}{_SIZE_UNITS[idx]}"
+
+
+# "rwxr-xr-x"-style strings for every combination of the nine permission bits
+_PERM_TABLE = tuple("".join("rwxrwxrwx"[i] if (m >> (8 - i)) & 1 else "-" for i in range(9)) for m in range(512))
 
 
 def format_permissions(mode: int) -> str:
-    perms = ""
-    for who in (
-        stat.S_IRUSR,
-        stat.S_IWUSR,
-        stat.S_IXUSR,
-        stat.S_IRGRP,
-        stat.S_IWGRP,
-        stat.S_IXGRP,
-        stat.S_IROTH,
-        stat.S_IWOTH,
-        stat.S_IXOTH,
-    ):
-        perms += "rwxrwxrwx"[len(perms)] if mode & who else "-"
     prefix = "d" if stat.S_ISDIR(mode) else "l" if stat.S_ISLNK(mode) else "-"
-    return prefix + perms
+    return prefix + _PERM_TABLE[mode & 0o777]
+
+
+# Files in a listing tend to share mtimes, so format each minute (or second) only once
+@lru_cache(maxsize=8192)
+def _format_minute(minute: int) -> str:
+    return datetime.fromtimestamp(minute * 60).strftime("%Y-%m-%d %H:%M")
+
+
+@lru_cache(maxsize=1024)
+def _format_second(second: int) -> str:
+    return datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def format_mtime(mtime: float, seconds: bool = False) -> str:
+    if seconds:
+        return _format_second(int(mtime // 1))
+    return _format_minute(int(mtime // 60))
+
+
+# User and group names barely change during a session, and lookups may go through NSS (LDAP, SSSD)
+@lru_cache(maxsize=512)
+def uid_name(uid: int) -> str:
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+@lru_cache(maxsize=512)
+def gid_name(gid: int) -> str:
+    try:
+        return grp.getgrgid(gid).gr_name
+    except KeyError:
+        return str(gid)
+
+
+class DirFd:
+    """An open directory descriptor that outlives its owner while stats are still using it.
+
+    The owner holds the first reference and drops it with release(). Each stat through
+    the descriptor holds its own reference for the duration of the syscall, so the fd is
+    only closed, and its number only reused, once nothing can still be resolving names
+    against it.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC)
+        self._refs = 1
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """Take a reference, or return False if the descriptor is already closed."""
+        with self._lock:
+            if self._refs == 0:
+                return False
+            self._refs += 1
+            return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._refs -= 1
+            if self._refs == 0:
+                os.close(self.fd)
+
+
+class Entry:
+    """A directory entry from ``os.scandir`` that compares equal to its Path.
+
+    The file type comes from the directory read, and the lstat result is kept
+    after the first call, so sorting and rendering a listing does not re-stat
+    every entry. When the listing was read through a DirFd, stats resolve the
+    bare name against it instead of walking the full path again, falling back
+    to the full path once the descriptor has been closed.
+    """
+
+    __slots__ = ("_dir_fd", "_is_dir", "_is_symlink", "_stat", "name", "markup", "path")
+
+    def __init__(self, entry: os.DirEntry[str], parent: Path, dir_fd: DirFd | None = None) -> None:
+        self._dir_fd = dir_fd
+        # Resolve the type now: for symlinks DirEntry stats lazily through the scandir fd
+        self._is_dir = entry.is_dir()
+        self._is_symlink = entry.is_symlink()
+        self._stat: os.stat_result | None = None
+        self.name = entry.name
+        self.markup = escape(entry.name)
+        self.path = parent / entry.name
+
+    def is_dir(self) -> bool:
+        return self._is_dir
+
+    def is_symlink(self) -> bool:
+        return self._is_symlink
+
+    def lstat(self) -> os.stat_result:
+        """Stat the entry without following symlinks, bypassing the cache."""
+        dir_fd = self._dir_fd
+        if dir_fd is not None and dir_fd.acquire():
+            try:
+                return os.stat(self.name, dir_fd=dir_fd.fd, follow_symlinks=False)
+            finally:
+                dir_fd.release()
+        return os.lstat(self.path)
+
+    def stat(self) -> os.stat_result:
+        if self._stat is None:
+            self._stat = self.lstat()
+        return self._stat
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Entry):
+            return self.path == other.path
+        if isinstance(other, Path):
+            return self.path == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.path)
+
+
+def scan_dir(path: Path, show_hidden: bool, dir_fd: DirFd | None = None) -> list[Entry]:
+    """List a directory with directories first, then by case-insensitive name.
+
+    If dir_fd is an open DirFd for path, it is read instead of path and the entries
+    stat through it for as long as it stays open.
+    """
+    dirs: list[Entry] = []
+    files: list[Entry] = []
+    with os.scandir(path if dir_fd is None else dir_fd.fd) as it:
+        for e in it:
+            if show_hidden or not e.name.startswith("."):
+                entry = Entry(e, path, dir_fd)
+                (dirs if entry.is_dir() else files).append(entry)
+    dirs.sort(key=lambda e: e.name.lower())
+    files.sort(key=lambda e: e.name.lower())
+    return dirs + files
+
+
+def stat_entries(entries: list[Entry], workers: int = 8, batch: int = 256) -> None:
+    """Fill in the cached lstat of each entry, overlapping the syscalls on a thread pool.
+
+    Runs as a thread worker and stops between batches once that worker is cancelled.
+    """
+
+    def lstat(entry: Entry) -> os.stat_result | None:
+        try:
+            return entry.lstat()
+        except OSError:
+            return None
+
+    worker = get_current_worker()
+    pending = [e for e in entries if e._stat is None]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(pending), batch):
+            if worker.is_cancelled:
+                return
+            chunk = pending[start : start + batch]
+            for entry, st in zip(chunk, pool.map(lstat, chunk)):
+                if st is not None:
+                    entry._stat = st
 
 
 class InputDialog(ModalScreen[str | None]):
@@ -203,37 +365,59 @@ class ParentPane(Widget):
     }
     """
 
+    _entries_cache: list[Entry] | None = None
+    _cached_render: str | None = None
+    _cached_key: tuple[Path, bool] | None = None
+
+    def invalidate(self) -> None:
+        """Drop the cached parent listing so the next render re-reads it."""
+        self._entries_cache = None
+        self._cached_render = None
+
     def render_entries(self) -> str:
         parent = self.current_dir.parent
         if parent == self.current_dir:
             return str(self.current_dir)
-        try:
-            entries = sorted(parent.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
-        except PermissionError:
-            return "[red]Permission denied[/]"
-        if not self.show_hidden:
-            entries = [e for e in entries if not e.name.startswith(".")]
-        lines = []
-        for entry in entries:
-            name = escape(entry.name)
-            if entry == self.current_dir:
-                lines.append(f"[bold reverse] {name}/ [/]")
-            elif entry.is_dir():
-                lines.append(f"[bold cyan] {name}/[/]")
-            else:
-                lines.append(f" {name}")
-        return "\n".join(lines)
+        if self._entries_cache is None:
+            try:
+                self._entries_cache = scan_dir(parent, self.show_hidden)
+            except PermissionError:
+                return "[red]Permission denied[/]"
+        entries = self._entries_cache
+        current = self.current_dir
+        return "\n".join(
+            f"[bold reverse] {e.markup}/ [/]"
+            if e == current
+            else f"[bold cyan] {e.markup}/[/]"
+            if e.is_dir()
+            else f" {e.markup}"
+            for e in entries
+        )
 
     def render(self) -> str:
-        return self.render_entries()
+        key = (self.current_dir, self.show_hidden)
+        if self._cached_render is None or self._cached_key != key:
+            self._cached_render = self.render_entries()
+            self._cached_key = key
+        return self._cached_render
 
     def watch_current_dir(self) -> None:
+        self.invalidate()
         self.refresh()
 
     def watch_show_hidden(self) -> None:
+        self.invalidate()
         self.refresh()
 
 
+# Row markup templates for FileList, by entry kind and by cursor state
+_DIR_FMT = "[bold cyan]%s/[/]"
+_LNK_FMT = "[magenta]%s@[/]"
+_EXE_FMT = "[green]%s*[/]"
+_ROW_FMT = " %s  [dim]%s  %s[/]"
+_SELECTED_ROW_FMT = "[reverse] %s  [dim]%s  %s[/][/]"
+
+
 class FileList(Widget, can_focus=True):
     """Main pane: lists files in current directory with details."""
 
@@ -249,20 +433,46 @@ class FileList(Widget, can_focus=True):
     """
 
     _scroll_top: int = 0
-
-    def get_entries(self) -> list[Path]:
-        try:
-            entries = sorted(
-                self.current_dir.iterdir(),
-                key=lambda p: (not p.is_dir(), p.name.lower()),
-            )
-        except PermissionError:
-            return []
-        if not self.show_hidden:
-            entries = [e for e in entries if not e.name.startswith(".")]
-        if self.filter_text:
-            entries = [e for e in entries if self.filter_text.lower() in e.name.lower()]
-        return entries
+    # The directory as read, before the filter, and the filtered view of it that the pane shows
+    _listing: list[Entry] | None = None
+    _entries_cache: list[Entry] | None = None
+    _counts: tuple[int, int] = (0, 0)
+    # Open descriptor for current_dir; entry stats resolve names relative to it
+    _dirfd: DirFd | None = None
+    # Markup for the visible rows, starting at _scroll_top, and the height they were laid out for
+    _rendered_rows: list[str] | None = None
+    _rendered_height: int = 0
+
+    def invalidate(self) -> None:
+        """Drop the cached listing so the next call to get_entries re-reads the directory."""
+        self._listing = None
+        self._entries_cache = None
+        self._rendered_rows = None
+
+    def get_entries(self) -> list[Entry]:
+        if self._entries_cache is None:
+            if self._listing is None:
+                try:
+                    if self._dirfd is None:
+                        self._dirfd = DirFd(self.current_dir)
+                    self._listing = scan_dir(self.current_dir, self.show_hidden, self._dirfd)
+                except PermissionError:
+                    self._listing = []
+                # Warm the stats of rows that have not scrolled into view yet
+                self.run_worker(partial(stat_entries, self._listing), thread=True, group="stat", exclusive=True)
+            entries = self._listing
+            if self.filter_text:
+                needle = self.filter_text.lower()
+                entries = [e for e in entries if needle in e.name.lower()]
+            self._entries_cache = entries
+            count_dirs = sum(1 for e in entries if e.is_dir())
+            self._counts = (count_dirs, len(entries) - count_dirs)
+        return self._entries_cache
+
+    def get_counts(self) -> tuple[int, int]:
+        """Return (dirs, files) for the current listing."""
+        self.get_entries()
+        return self._counts
 
     def render_list(self) -> str:
         entries = self.get_entries()
@@ -277,52 +487,83 @@ class FileList(Widget, can_focus=True):
         elif self.cursor >= self._scroll_top + visible:
             self._scroll_top = self.cursor - visible + 1
 
-        lines = []
-        for i in range(self._scroll_top, min(self._scroll_top + visible, len(entries))):
-            entry = entries[i]
-            try:
-                st = entry.lstat()
-                size = format_size(st.st_size)
-                mtime = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M")
-            except OSError:
-                size = "    ?"
-                mtime = "               ?"
-
-            name = escape(entry.name)
-            if entry.is_dir():
-                display = f"[bold cyan]{name}/[/]"
-            elif entry.is_symlink():
-                display = f"[magenta]{name}@[/]"
-            elif os.access(entry, os.X_OK):
-                display = f"[green]{name}*[/]"
-            else:
-                display = name
-
-            prefix = "[reverse]" if i == self.cursor else ""
-            suffix = "[/]" if i == self.cursor else ""
-            lines.append(f"{prefix} {display}  [dim]{size}  {mtime}[/]{suffix}")
+        cursor = self.cursor
+        format_row = self._format_row
+        end = min(self._scroll_top + visible, len(entries))
+        lines = [format_row(entries[i], i == cursor) for i in range(self._scroll_top, end)]
+        self._rendered_rows = lines
+        self._rendered_height = visible
         return "\n".join(lines)
 
+    def _format_row(self, entry: Entry, selected: bool) -> str:
+        # One lstat gives size, mtime and every type bit used for colouring
+        try:
+            st = entry.stat()
+            size = format_size(st.st_size)
+            mtime = format_mtime(st.st_mtime)
+            mode = st.st_mode
+            is_lnk = stat.S_ISLNK(mode)
+            # A symlink to a directory still lists as a directory
+            is_dir = stat.S_ISDIR(mode) or (is_lnk and entry.is_dir())
+            is_exe = bool(mode & 0o111)
+        except OSError:
+            size = "    ?"
+            mtime = "               ?"
+            is_dir = entry.is_dir()
+            is_lnk = entry.is_symlink()
+            is_exe = False
+
+        display = (_DIR_FMT if is_dir else _LNK_FMT if is_lnk else _EXE_FMT if is_exe else "%s") % entry.markup
+        return (_SELECTED_ROW_FMT if selected else _ROW_FMT) % (display, size, mtime)
+
     def render(self) -> str:
+        if self._rendered_rows is not None and self._rendered_height == max(1, self.size.height):
+            return "\n".join(self._rendered_rows)
         return self.render_list()
 
+    def _close_dirfd(self) -> None:
+        # Workers still statting the old listing keep the fd open until their current stat returns
+        if self._dirfd is not None:
+            self._dirfd.release()
+            self._dirfd = None
+
+    def on_unmount(self) -> None:
+        self._close_dirfd()
+
     def watch_current_dir(self) -> None:
+        self.invalidate()
+        self._close_dirfd()
         self._scroll_top = 0
         self.cursor = 0
         self.refresh()
 
-    def watch_cursor(self) -> None:
+    def watch_cursor(self, old: int, new: int) -> None:
+        # Within the visible window only the two highlighted rows change, so patch them in place
+        rows = self._rendered_rows
+        top = self._scroll_top
+        if rows is not None and top <= old < top + len(rows) and top <= new < top + len(rows):
+            entries = self.get_entries()
+            rows[old - top] = self._format_row(entries[old], False)
+            rows[new - top] = self._format_row(entries[new], True)
+        else:
+            self._rendered_rows = None
         self.refresh()
 
     def watch_show_hidden(self) -> None:
+        self.invalidate()
         self._scroll_top = 0
         self.cursor = 0
         self.refresh()
 
+    def watch_filter_text(self) -> None:
+        # Re-filter the listing already read; the directory itself has not changed
+        self._entries_cache = None
+        self._rendered_rows = None
+
     def selected_path(self) -> Path | None:
         entries = self.get_entries()
         if 0 <= self.cursor < len(entries):
-            return entries[self.cursor]
+            return entries[self.cursor].path
         return None
 
 
@@ -343,6 +584,8 @@ class PreviewPane(Widget):
     MAX_PREVIEW_LINES = 80
     MAX_LINE_LEN = 200
     MAX_PREVIEW_BYTES = 64 * 1024  # 64 KB
+    READ_CHUNK = 4096
+    SETTLE_DELAY = 0.05  # seconds the path must stay put before it is read
 
     BINARY_EXTENSIONS = frozenset(
         {
@@ -403,8 +646,11 @@ class PreviewPane(Widget):
         }
     )
 
-    def render_preview(self) -> str:
-        path = self.preview_path
+    _pending: Path | None = None
+    _settle_timer: Timer | None = None
+    _last_rendered: str | Text | None = ""
+
+    def _compute_preview(self, path: Path | None) -> str | Text:
         if path is None:
             return ""
         if not path.exists():
@@ -414,33 +660,20 @@ class PreviewPane(Widget):
         try:
             st = path.lstat()
             perms = format_permissions(st.st_mode)
-            try:
-                owner = pwd.getpwuid(st.st_uid).pw_name
-            except KeyError:
-                owner = str(st.st_uid)
-            try:
-                group = grp.getgrgid(st.st_gid).gr_name
-            except KeyError:
-                group = str(st.st_gid)
+            owner = uid_name(st.st_uid)
+            group = gid_name(st.st_gid)
             size = format_size(st.st_size)
-            mtime = datetime.fromtimestamp(st.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
+            mtime = format_mtime(st.st_mtime, seconds=True)
             header = f"[dim]{perms}  {escape(owner)}:{escape(group)}  {size}  {mtime}[/]\n\n"
         except OSError:
             header = ""
 
         if path.is_dir():
             try:
-                entries = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name.lower()))
+                entries = scan_dir(path, self.show_hidden)
             except PermissionError:
                 return header + "[red]Permission denied[/]"
-            if not self.show_hidden:
-                entries = [e for e in entries if not e.name.startswith(".")]
-            lines = []
-            for e in entries[:50]:
-                if e.is_dir():
-                    lines.append(f"[bold cyan]{escape(e.name)}/[/]")
-                else:
-                    lines.append(escape(e.name))
+            lines = [f"[bold cyan]{e.markup}/[/]" if e.is_dir() else e.markup for e in entries[:50]]
             if len(entries) > 50:
                 lines.append(f"[dim]... and {len(entries) - 50} more[/]")
             return header + "\n".join(lines)
@@ -451,35 +684,89 @@ class PreviewPane(Widget):
 
         # Skip large files
         try:
-            file_size = path.stat().st_size
+            file_st = path.stat()
         except OSError:
-            file_size = 0
-        if file_size > self.MAX_PREVIEW_BYTES:
-            return header + f"[dim italic]File too large for preview ({format_size(file_size)})[/]"
+            return header + "[dim italic]Cannot read file[/]"
+        if file_st.st_size > self.MAX_PREVIEW_BYTES:
+            return header + f"[dim italic]File too large for preview ({format_size(file_st.st_size)})[/]"
 
-        # Try reading as text — bail on null bytes (binary)
         try:
-            raw = path.read_bytes()[: self.MAX_PREVIEW_BYTES]
-            if b"\x00" in raw[:1024]:
+            content = self._read_text_preview(str(path), file_st.st_mtime_ns, file_st.st_size)
+            if content is None:
                 return header + "[dim italic]Binary file[/]"
-            text = raw.decode("utf-8", errors="replace")
-            lines = text.splitlines()[: self.MAX_PREVIEW_LINES]
-            truncated = [ln[: self.MAX_LINE_LEN] for ln in lines]
-            content = "\n".join(truncated)
             result = Text.from_markup(header)
             result.append(content)
             return result
         except Exception:
             return header + "[dim italic]Cannot read file[/]"
 
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _read_text_preview(path: str, mtime_ns: int, size: int) -> str | None:
+        """Return the first lines of a text file, or None if it looks binary.
+
+        mtime_ns and size only key the cache, so an edited file is read again.
+        """
+        with open(path, "rb") as f:
+            raw = f.read(PreviewPane.READ_CHUNK)
+            # Bail on null bytes (binary)
+            if b"\x00" in raw[:1024]:
+                return None
+            # Stop reading once the preview's worth of lines is buffered
+            newlines = raw.count(b"\n")
+            while newlines < PreviewPane.MAX_PREVIEW_LINES and len(raw) < PreviewPane.MAX_PREVIEW_BYTES:
+                chunk = f.read(PreviewPane.READ_CHUNK)
+                if not chunk:
+                    break
+                raw += chunk
+                newlines += chunk.count(b"\n")
+        text = raw[: PreviewPane.MAX_PREVIEW_BYTES].decode("utf-8", errors="replace")
+        lines = text.splitlines()[: PreviewPane.MAX_PREVIEW_LINES]
+        return "\n".join(ln[: PreviewPane.MAX_LINE_LEN] for ln in lines)
+
+    @classmethod
+    def prefetch(cls, path: Path) -> None:
+        """Warm the text preview cache for path, if it would be previewed as text."""
+        if path.suffix.lower() in cls.BINARY_EXTENSIONS:
+            return
+        try:
+            st = path.stat()
+            if stat.S_ISREG(st.st_mode) and st.st_size <= cls.MAX_PREVIEW_BYTES:
+                cls._read_text_preview(str(path), st.st_mtime_ns, st.st_size)
+        except Exception:
+            pass
+
+    def invalidate(self) -> None:
+        """Recompute the preview once the current path has been stable for SETTLE_DELAY."""
+        self._pending = self.preview_path
+        if self._settle_timer is not None:
+            self._settle_timer.stop()
+        self._settle_timer = self.set_timer(self.SETTLE_DELAY, self._materialize)
+
+    def _materialize(self) -> None:
+        if self.preview_path != self._pending:
+            return
+        self._last_rendered = None
+        self.refresh()
+        # Exclusive, so a newer path cancels a load that is still waiting on the disk
+        self.run_worker(self._load_preview(self.preview_path), group="preview", exclusive=True)
+
+    async def _load_preview(self, path: Path | None) -> None:
+        result = await asyncio.to_thread(self._compute_preview, path)
+        if self.preview_path == path:
+            self._last_rendered = result
+            self.refresh()
+
     def render(self) -> str | Text:
-        return self.render_preview()
+        if self._last_rendered is None:
+            return "[dim]Loading…[/]"
+        return self._last_rendered
 
     def watch_preview_path(self) -> None:
-        self.refresh()
+        self.invalidate()
 
     def watch_show_hidden(self) -> None:
-        self.refresh()
+        self.invalidate()
 
 
 class StatusBar(Widget):
@@ -550,6 +837,11 @@ class Explorer(App):
     _yank_path: Path | None = None
     _yank_cut: bool = False
     _filter_active: bool = False
+    _preview_timer: Timer | None = None
+    _home: Path = Path.home()
+
+    PREVIEW_DEBOUNCE = 0.08  # seconds
+    PREFETCH_AHEAD = 16  # entries below the cursor to stat and pre-read
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -594,19 +886,44 @@ class Explorer(App):
         preview = self.query_one(PreviewPane)
         preview.show_hidden = self.show_hidden
         preview.preview_path = file_list.selected_path()
+        self._prefetch()
+
+    def _prefetch(self) -> None:
+        """Stat and pre-read the entries just below the cursor, where it is likely to go next."""
+        fl = self.query_one(FileList)
+        ahead = fl.get_entries()[fl.cursor + 1 : fl.cursor + 1 + self.PREFETCH_AHEAD]
+        if ahead:
+            self.run_worker(partial(self._prefetch_entries, ahead), thread=True, group="prefetch", exclusive=True)
+
+    def _prefetch_entries(self, entries: list[Entry]) -> None:
+        worker = get_current_worker()
+        for entry in entries:
+            if worker.is_cancelled:
+                return
+            try:
+                entry.stat()
+            except OSError:
+                continue
+            PreviewPane.prefetch(entry.path)
+
+    def _schedule_preview(self) -> None:
+        """Update the preview once the cursor has settled, so held keys don't read every file passed."""
+        if self._preview_timer is not None:
+            self._preview_timer.stop()
+        self._preview_timer = self.set_timer(self.PREVIEW_DEBOUNCE, self._update_preview)
 
     def action_cursor_down(self) -> None:
         fl = self.query_one(FileList)
         entries = fl.get_entries()
         if fl.cursor < len(entries) - 1:
             fl.cursor += 1
-            self._update_preview()
+            self._schedule_preview()
 
     def action_cursor_up(self) -> None:
         fl = self.query_one(FileList)
         if fl.cursor > 0:
             fl.cursor -= 1
-            self._update_preview()
+            self._schedule_preview()
 
     def action_enter_dir(self) -> None:
         fl = self.query_one(FileList)
@@ -667,16 +984,18 @@ class Explorer(App):
         self._sync_all()
 
     def action_go_home(self) -> None:
-        self.current_dir = Path.home()
+        self.current_dir = self._home
 
     def _refresh_view(self) -> None:
         fl = self.query_one(FileList)
+        fl.invalidate()
+        self.query_one(ParentPane).invalidate()
         entries = fl.get_entries()
         if fl.cursor >= len(entries):
             fl.cursor = max(0, len(entries) - 1)
         self.query_one(ParentPane).refresh()
         fl.refresh()
-        self.query_one(PreviewPane).refresh()
+        self.query_one(PreviewPane).invalidate()
         self._sync_all()
 
     def action_yank_copy(self) -> None:
@@ -801,9 +1120,7 @@ class Explorer(App):
     def _update_status(self) -> None:
         fl = self.query_one(FileList)
         status_bar = self.query_one(StatusBar)
-        entries = fl.get_entries()
-        count_dirs = sum(1 for e in entries if e.is_dir())
-        count_files = len(entries) - count_dirs
+        count_dirs, count_files = fl.get_counts()
         yank_info = ""
         if self._yank_path is not None:
             mode = "cut" if self._yank_cut else "copied"